@@ -4,10 +4,12 @@
 from __future__ import annotations
 
 import logging
+import socket
+from contextlib import AsyncExitStack
 from typing import TYPE_CHECKING
 
-import aiohttp  # Add this import
 from homeassistant.const import Platform
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 # Updated import name
 from .aux_cloud import AuxCloudAPI
@@ -26,27 +28,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN].setdefault(entry.entry_id, {})
 
-    # Create a shared session for the entry
-    session = aiohttp.ClientSession()
-    hass.data[DOMAIN][entry.entry_id]["session"] = session
-
+    # Reuse Home Assistant's shared session so connections are pooled process-wide
     client = AuxCloudAPI(
         email=entry.data[CONF_EMAIL],
         password=entry.data[CONF_PASSWORD],
         region=entry.data[CONF_REGION],
-        session=session,
+        session=async_get_clientsession(hass, family=socket.AF_INET),
     )
 
-    try:
-        await client.login()
-        await client.refresh()
-    except Exception:
-        await client.cleanup()
-        await session.close()
-        _LOGGER.exception("Failed to connect to AUX AC")
-        return False
+    async with AsyncExitStack() as stack:
+        # Unwound on failure so the client is torn down even if setup half-finished
+        stack.push_async_callback(client.cleanup)
+        try:
+            await client.login()
+            devices = await client.get_devices()
+        except Exception:
+            _LOGGER.exception("Failed to connect to AUX AC")
+            return False
+        stack.pop_all()
 
     hass.data[DOMAIN][entry.entry_id]["client"] = client
+    # Fetched once here and shared by the platforms to avoid repeat cloud calls
+    hass.data[DOMAIN][entry.entry_id]["devices"] = devices
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -58,12 +61,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         entry_data = hass.data[DOMAIN].get(entry.entry_id, {})
         client = entry_data.get("client")
-        session = entry_data.get("session")
 
         if client:
             await client.cleanup()
-        if session and not session.closed:
-            await session.close()
 
         hass.data[DOMAIN].pop(entry.entry_id, None)
     return unload_ok
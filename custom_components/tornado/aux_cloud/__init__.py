@@ -192,6 +192,10 @@ class AuxCloudAPI:
                 _LOGGER.debug("Using shared session: %s", id(self.session))
             return self.session
 
+        # Externally provided sessions (e.g. Home Assistant's) are used as-is
+        if self.session is not None and not self.session.closed:
+            return self.session
+
         return await self.get_shared_session()
 
     async def cleanup(self) -> None:
@@ -351,6 +355,8 @@ class AuxCloudAPI:
                 AES_INITIAL_VECTOR, md5_hash, json_payload.encode()
             ),
             headers=self._get_headers(timestamp=f"{current_time}", token=token),
+            timeout=self.timeout,
+            raise_for_status=True,
         ) as resp:
             data = await resp.text()
             json_data = json.loads(data)
@@ -419,6 +425,8 @@ class AuxCloudAPI:
         async with session.post(
             f"{self.url}/appsync/group/member/getfamilylist",
             headers=self._get_headers(),
+            timeout=self.timeout,
+            raise_for_status=True,
         ) as response:
             data = await response.text()
             try:
@@ -497,6 +505,8 @@ class AuxCloudAPI:
             f"{self.url}/appsync/group/{device_endpoint}",
             data='{"pids":[]}' if not shared else '{"endpointId":""}',
             headers=self._get_headers(familyid=family_id),
+            timeout=self.timeout,
+            raise_for_status=True,
         ) as response:
             data = await response.text()
             json_data = json.loads(data)
@@ -637,6 +647,8 @@ class AuxCloudAPI:
             f"{self.url}/device/control/v2/querystate",
             data=json.dumps(data, separators=(",", ":")),
             headers=self._get_headers(),
+            timeout=self.timeout,
+            raise_for_status=True,
         ) as response:
             data = await response.text()
             _LOGGER.debug("Received response: %s", data)
@@ -672,6 +684,8 @@ class AuxCloudAPI:
                 separators=(",", ":"),
             ),
             headers=self._get_headers(),
+            timeout=self.timeout,
+            raise_for_status=True,
         ) as resp:
             data = await resp.text()
             _LOGGER.debug("Received response: %s", data)
@@ -789,6 +803,8 @@ class AuxCloudAPI:
             params={"license": LICENSE},
             data=json.dumps(data, separators=(",", ":")),
             headers=self._get_headers(),
+            timeout=self.timeout,
+            raise_for_status=True,
         ) as resp:
             response_text = await resp.text()
             json_data = json.loads(response_text)
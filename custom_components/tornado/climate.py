@@ -18,6 +18,7 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .aux_cloud import AuxCloudAPI
@@ -53,9 +54,26 @@ FAN_MODE_MAP = {
 
 FAN_MODE_MAP_REVERSE = {v: k for k, v in FAN_MODE_MAP.items()}
 
+# Map Home Assistant modes to the action reported while the device is on
+HVAC_ACTION_MAP = {
+    HVACMode.COOL: HVACAction.COOLING,
+    HVACMode.HEAT: HVACAction.HEATING,
+    HVACMode.DRY: HVACAction.DRYING,
+    HVACMode.FAN_ONLY: HVACAction.FAN,
+    HVACMode.AUTO: HVACAction.IDLE,
+}
+
 # Available swing modes
 SWING_MODES = ["off", "vertical", "horizontal", "both"]
 
+# Map (vertical, horizontal) direction flags to swing modes
+SWING_MODE_MAP = {
+    (0, 0): "off",
+    (1, 0): "vertical",
+    (0, 1): "horizontal",
+    (1, 1): "both",
+}
+
 # Parameter validation
 PARAMETER_VALIDATION = {
     "ac_vdir": {"type": int, "range": (0, 1), "required": False},
@@ -91,11 +109,15 @@ async def async_setup_entry(
         _LOGGER.info("Initial login for AuxCloud client")
         await client.login()
 
+    # Seed the coordinator with the devices fetched during entry setup; the
+    # snapshot is dropped since the coordinator owns device data from here on
+    devices = entry_data.pop("devices")
     coordinator = AuxCloudDataUpdateCoordinator(hass, client)
-    await coordinator.async_refresh()
+    coordinator.async_set_updated_data(
+        {device["endpointId"]: device for device in devices}
+    )
 
     try:
-        devices = await client.get_devices()
         entities = []
 
         for device in devices:
@@ -129,6 +151,11 @@ class AuxCloudDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name="AuxCloud",
             update_interval=timedelta(minutes=1),
+            # Delay requested refreshes so commands sent within the cooldown
+            # share one refresh and never wait on it
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=0.3, immediate=False
+            ),
         )
 
     async def _async_update_data(self) -> dict:
@@ -165,9 +192,10 @@ class TornadoClimateEntity(ClimateEntity):
         self._client = coordinator.api
         self._device_id = device["endpointId"]
         self._attr_unique_id = f"{device['endpointId']}_climate"
+        name = f"Tornado AC {device.get('friendlyName')}"
         self._attr_device_info = {
             "identifiers": {(DOMAIN, device["endpointId"])},
-            "name": f"Tornado AC {device.get('friendlyName')}",
+            "name": name,
             "manufacturer": "Tornado",
             "model": "AUX Cloud",
         }
@@ -196,10 +224,12 @@ class TornadoClimateEntity(ClimateEntity):
         self._attr_swing_mode = None
         self._attr_hvac_action = HVACAction.OFF
         self._attr_available = False
+        # State is pushed by the coordinator listener, which does its own polling
+        self._attr_should_poll = False
         # Create entity description
         self.entity_description = ClimateEntityDescription(
             key=self._attr_unique_id,
-            name=f"Tornado AC {device.get('friendlyName')}",
+            name=name,
             translation_key=DOMAIN,
         )
 
@@ -237,63 +267,74 @@ class TornadoClimateEntity(ClimateEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from coordinator."""
-        _LOGGER.debug(
-            "Handling coordinator update for device %s with data: %s",
-            self._device_id,
-            self._device,
-        )
+        device = self._device
+        # Runs per device on every poll, so avoid building log args needlessly
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Handling coordinator update for device %s with data: %s",
+                self._device_id,
+                device,
+            )
 
-        if not self._device:
+        if not device:
             self._attr_available = False
             self.async_write_ha_state()
             return
 
         try:
-            device_params = self._device.get("params", {})
+            device_params = device.get("params", {})
 
             # Update power and HVAC mode/action
             if not device_params.get("pwr", 0):
-                self._attr_hvac_mode = HVACMode.OFF
-                self._attr_hvac_action = HVACAction.OFF
+                hvac_mode = HVACMode.OFF
+                hvac_action = HVACAction.OFF
             else:
-                self._attr_hvac_mode = HVAC_MODE_MAP.get(
+                hvac_mode = HVAC_MODE_MAP.get(
                     device_params.get("ac_mode", 0), HVACMode.OFF
                 )
-                self._attr_hvac_action = {
-                    HVACMode.COOL: HVACAction.COOLING,
-                    HVACMode.HEAT: HVACAction.HEATING,
-                    HVACMode.DRY: HVACAction.DRYING,
-                    HVACMode.FAN_ONLY: HVACAction.FAN,
-                    HVACMode.AUTO: HVACAction.IDLE,
-                }.get(self._attr_hvac_mode, HVACAction.IDLE)
+                hvac_action = HVAC_ACTION_MAP.get(hvac_mode, HVACAction.IDLE)
 
             # Update other attributes
-            self._attr_fan_mode = FAN_MODE_MAP.get(
-                device_params.get("ac_mark", 0), "auto"
-            )
-            self._attr_target_temperature = device_params.get("temp", 0) / 10
-            self._attr_current_temperature = device_params.get("envtemp", 0) / 10
+            fan_mode = FAN_MODE_MAP.get(device_params.get("ac_mark", 0), "auto")
+            target_temperature = device_params.get("temp", 0) / 10
+            current_temperature = device_params.get("envtemp", 0) / 10
             # Update swing mode based on vertical and horizontal direction
             v_dir = device_params.get("ac_vdir", 0)
             h_dir = device_params.get("ac_hdir", 0)
-            self._attr_swing_mode = {
-                (0, 0): "off",
-                (1, 0): "vertical",
-                (0, 1): "horizontal",
-                (1, 1): "both",
-            }.get((v_dir, h_dir), "off")
-
-            self._attr_available = True
-
-            _LOGGER.debug(
-                "Updated state for %s: mode=%s, action=%s, fan=%s, temp=%s, envtemp=%s",
-                self._device_id,
-                self._attr_hvac_mode,
-                self._attr_hvac_action,
-                self._attr_fan_mode,
-                self._attr_target_temperature,
-                self._attr_current_temperature,
-            )
+            swing_mode = SWING_MODE_MAP.get((v_dir, h_dir), "off")
+
+            available = self.available
+            # Skip the state write when nothing visible has changed
+            if (
+                available == self._attr_available
+                and hvac_mode == self._attr_hvac_mode
+                and hvac_action == self._attr_hvac_action
+                and fan_mode == self._attr_fan_mode
+                and target_temperature == self._attr_target_temperature
+                and current_temperature == self._attr_current_temperature
+                and swing_mode == self._attr_swing_mode
+            ):
+                return
+
+            self._attr_hvac_mode = hvac_mode
+            self._attr_hvac_action = hvac_action
+            self._attr_fan_mode = fan_mode
+            self._attr_target_temperature = target_temperature
+            self._attr_current_temperature = current_temperature
+            self._attr_swing_mode = swing_mode
+            self._attr_available = available
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Updated state for %s: mode=%s, action=%s, fan=%s, temp=%s, "
+                    "envtemp=%s",
+                    self._device_id,
+                    self._attr_hvac_mode,
+                    self._attr_hvac_action,
+                    self._attr_fan_mode,
+                    self._attr_target_temperature,
+                    self._attr_current_temperature,
+                )
 
         except Exception:
             _LOGGER.exception("Error updating state for %s", self._device_id)
@@ -303,17 +344,34 @@ class TornadoClimateEntity(ClimateEntity):
 
     async def async_update(self) -> None:
         """Update the entity."""
-        await self._coordinator.async_request_refresh()
+        await self._coordinator.async_refresh()
+
+    async def _set_device_params(self, params: dict, **optimistic: Any) -> None:
+        """
+        Set device parameters and handle any errors.
+
+        Args:
+            params: Dictionary of parameter names and values to send
+            **optimistic: Entity attributes to show immediately, reset on error
+
+        """
+        if optimistic:
+            for attr, value in optimistic.items():
+                setattr(self, attr, value)
+            self.async_write_ha_state()
 
-    async def _set_device_params(self, params: dict) -> None:
-        """Set device parameters and handle any errors."""
         try:
             await self._client.set_device_params(self._device, params)
         except Exception:
-            _LOGGER.exception(
-                "Error setting parameters for %s",
-                self._device.get("endpointId", "Unknown"),
-            )
+            _LOGGER.exception("Error setting parameters for %s", self._device_id)
+            if optimistic:
+                # Re-derive from the latest coordinator data, which may be newer
+                # than the state before this call
+                self._handle_coordinator_update()
+            return
+
+        # Reconcile with the device shortly instead of waiting for the next poll
+        await self._coordinator.async_request_refresh()
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
@@ -328,7 +386,9 @@ class TornadoClimateEntity(ClimateEntity):
         _LOGGER.info(
             "Setting temperature to %s for %s", temp, self._device.get("endpointId")
         )
-        await self._set_device_params({"temp": int(temp * 10)})
+        await self._set_device_params(
+            {"temp": int(temp * 10)}, _attr_target_temperature=temp
+        )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
@@ -342,7 +402,15 @@ class TornadoClimateEntity(ClimateEntity):
             if hvac_mode == HVACMode.OFF
             else {"pwr": 1, "ac_mode": HVAC_MODE_MAP_REVERSE.get(hvac_mode, "auto")}
         )
-        await self._set_device_params(params)
+        await self._set_device_params(
+            params,
+            _attr_hvac_mode=hvac_mode,
+            _attr_hvac_action=(
+                HVACAction.OFF
+                if hvac_mode == HVACMode.OFF
+                else HVAC_ACTION_MAP.get(hvac_mode, HVACAction.IDLE)
+            ),
+        )
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new target fan mode."""
@@ -352,7 +420,8 @@ class TornadoClimateEntity(ClimateEntity):
             self._device.get("endpointId", "Unknown"),
         )
         await self._set_device_params(
-            {"ac_mark": FAN_MODE_MAP_REVERSE.get(fan_mode, 1)}
+            {"ac_mark": FAN_MODE_MAP_REVERSE.get(fan_mode, 1)},
+            _attr_fan_mode=fan_mode,
         )
 
     async def async_set_swing_mode(self, swing_mode: str) -> None:
@@ -363,27 +432,22 @@ class TornadoClimateEntity(ClimateEntity):
             "ac_vdir": 1 if swing_mode in ["vertical", "both"] else 0,
             "ac_hdir": 1 if swing_mode in ["horizontal", "both"] else 0,
         }
-        await self._set_device_params(params)
+        await self._set_device_params(params, _attr_swing_mode=swing_mode)
 
     async def async_turn_on(self) -> None:
         """Turn the device on."""
         _LOGGER.info("Turning on %s", self._device.get("endpointId", "Unknown"))
-        try:
-            await self._client.set_device_params(self._device, {"pwr": 1})
-        except Exception:
-            _LOGGER.exception(
-                "Error turning on %s", self._device.get("endpointId", "Unknown")
-            )
+        # The resulting mode is only known once the device reports back
+        await self._set_device_params({"pwr": 1})
 
     async def async_turn_off(self) -> None:
         """Turn the device off."""
         _LOGGER.info("Turning off %s", self._device.get("endpointId", "Unknown"))
-        try:
-            await self._client.set_device_params(self._device, {"pwr": 0})
-        except Exception:
-            _LOGGER.exception(
-                "Error turning off %s", self._device.get("endpointId", "Unknown")
-            )
+        await self._set_device_params(
+            {"pwr": 0},
+            _attr_hvac_mode=HVACMode.OFF,
+            _attr_hvac_action=HVACAction.OFF,
+        )
 
 
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
@@ -1,7 +1,9 @@
 """Tests for the Tornado AC climate component."""
 
 import contextlib
-from unittest.mock import AsyncMock, MagicMock
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.components.climate import (
@@ -14,6 +16,8 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
 from custom_components.tornado.climate import (
     DOMAIN,
@@ -26,6 +30,7 @@ MIN_TEMP = 16
 MAX_TEMP = 32
 CURRENT_TEMP = 27.0
 TARGET_TEMP = 25.0
+NEW_TARGET_TEMP = 24.0
 
 MOCK_DEVICE = {
     "endpointId": "test_device_id",
@@ -281,6 +286,35 @@ async def test_coordinator_update_with_invalid_data(
     assert entity.hvac_mode == HVACMode.COOL  # Retains last known mode
 
 
+async def test_coordinator_update_unchanged_skips_write(
+    coordinator: AuxCloudDataUpdateCoordinator, entity: TornadoClimateEntity
+) -> None:
+    """Test that an update with unchanged data does not write state."""
+    with patch.object(entity, "async_write_ha_state") as mock_write:
+        coordinator.async_set_updated_data({MOCK_DEVICE["endpointId"]: MOCK_DEVICE})
+        mock_write.assert_not_called()
+
+        changed_device = {
+            **MOCK_DEVICE,
+            "params": {**MOCK_DEVICE["params"], "temp": 240},
+        }
+        coordinator.async_set_updated_data({MOCK_DEVICE["endpointId"]: changed_device})
+        mock_write.assert_called_once()
+
+
+async def test_coordinator_update_after_optimistic_state(
+    coordinator: AuxCloudDataUpdateCoordinator, entity: TornadoClimateEntity
+) -> None:
+    """Test that unchanged device data still replaces optimistic state."""
+    with patch.object(coordinator, "async_request_refresh", AsyncMock()):
+        await entity.async_set_temperature(**{ATTR_TEMPERATURE: NEW_TARGET_TEMP})
+    assert entity.target_temperature == NEW_TARGET_TEMP
+
+    # The device did not apply the change, so its reported params are unchanged
+    coordinator.async_set_updated_data({MOCK_DEVICE["endpointId"]: MOCK_DEVICE})
+    assert entity.target_temperature == TARGET_TEMP
+
+
 async def test_set_invalid_temperature(
     entity: TornadoClimateEntity, mock_api: MagicMock
 ) -> None:
@@ -307,6 +341,74 @@ async def test_api_error_handling(
     mock_api.set_device_params.assert_called_once()
 
 
+async def test_optimistic_state(
+    entity: TornadoClimateEntity, mock_api: MagicMock
+) -> None:
+    """Test state is updated before the cloud call and reverted on error."""
+
+    async def assert_optimistic(device: dict, params: dict) -> None:
+        assert entity.target_temperature == NEW_TARGET_TEMP
+        assert device is MOCK_DEVICE
+        assert params == {"temp": 240}
+
+    mock_api.set_device_params.side_effect = assert_optimistic
+    await entity.async_set_temperature(**{ATTR_TEMPERATURE: NEW_TARGET_TEMP})
+    assert entity.target_temperature == NEW_TARGET_TEMP
+
+    # A failed call restores the previous state
+    mock_api.set_device_params.side_effect = Exception("API Error")
+    await entity.async_set_fan_mode("high")
+    assert entity.fan_mode == "low"
+
+
+async def test_commands_request_debounced_refresh(
+    hass: HomeAssistant, entity: TornadoClimateEntity, mock_api: MagicMock
+) -> None:
+    """Test commands schedule one shared refresh instead of awaiting one each."""
+    mock_api.get_devices.reset_mock()
+
+    await entity.async_set_temperature(**{ATTR_TEMPERATURE: NEW_TARGET_TEMP})
+    await entity.async_set_fan_mode("high")
+    mock_api.get_devices.assert_not_called()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    mock_api.get_devices.assert_called_once()
+
+
+async def test_optimistic_state_failure_uses_latest_data(
+    coordinator: AuxCloudDataUpdateCoordinator,
+    entity: TornadoClimateEntity,
+    mock_api: MagicMock,
+) -> None:
+    """Test a failed call shows data polled during the call, not older state."""
+    polled_device = {**MOCK_DEVICE, "params": {**MOCK_DEVICE["params"], "ac_mark": 2}}
+
+    async def poll_then_fail(*_: Any) -> None:
+        assert entity.hvac_mode == HVACMode.HEAT
+        assert entity.hvac_action == HVACAction.HEATING
+        coordinator.async_set_updated_data({MOCK_DEVICE["endpointId"]: polled_device})
+        msg = "API Error"
+        raise ValueError(msg)
+
+    mock_api.set_device_params.side_effect = poll_then_fail
+    await entity.async_set_hvac_mode(HVACMode.HEAT)
+
+    assert entity.hvac_mode == HVACMode.COOL
+    assert entity.hvac_action == HVACAction.COOLING
+    assert entity.fan_mode == "medium"
+
+    # A device that disappeared during the call leaves the entity unavailable
+    async def remove_then_fail(*_: Any) -> None:
+        coordinator.async_set_updated_data({})
+        msg = "API Error"
+        raise ValueError(msg)
+
+    mock_api.set_device_params.side_effect = remove_then_fail
+    await entity.async_set_hvac_mode(HVACMode.OFF)
+    assert entity.available is False
+
+
 async def test_hvac_action_mapping(
     coordinator: AuxCloudDataUpdateCoordinator,
     entity: TornadoClimateEntity,
@@ -3,17 +3,24 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import socket
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 import pytest
+import tenacity
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 from custom_components.tornado.aux_cloud import AuxCloudAPI
 
 # Constants
 CONNECTION_POOL_LIMIT = 10
+REQUEST_TIMEOUT_TOTAL = 30
+NUM_OF_API_RETRIES = 3
+HTTP_BAD_GATEWAY = 502
 
 
 @pytest.fixture(autouse=True)
@@ -216,6 +223,80 @@ async def test_session_reuse() -> None:
     await api.cleanup()
 
 
+@pytest.mark.asyncio
+async def test_external_session_used() -> None:
+    """Test that an externally provided session is used instead of the shared one."""
+    external_session = MagicMock(spec=aiohttp.ClientSession)
+    external_session.closed = False
+    api = AuxCloudAPI("test@example.com", "password", session=external_session)
+
+    assert await api._get_session() is external_session
+    assert AuxCloudAPI._shared_session is None
+
+    # Cleanup never closes a session we don't own
+    await api.cleanup()
+    external_session.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_external_session_request_timeout() -> None:
+    """Test that requests on an external session use the API client timeout."""
+    response = MagicMock()
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock()
+    response.text = AsyncMock(
+        return_value=json.dumps(
+            {"event": {"payload": {"status": 0, "data": [{"state": 1}]}}}
+        )
+    )
+    external_session = MagicMock(spec=aiohttp.ClientSession)
+    external_session.closed = False
+    external_session.post.return_value = response
+    api = AuxCloudAPI("test@example.com", "password", session=external_session)
+    api.userid = "user1"
+
+    await api.query_device_state("dev1", "sess1")
+
+    assert external_session.post.call_args.kwargs["timeout"] is api.timeout
+    assert api.timeout.total == REQUEST_TIMEOUT_TOTAL
+    assert AuxCloudAPI._shared_session is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("socket_enabled")
+async def test_external_session_retries_server_errors() -> None:
+    """Test that 5xx responses on an external session are retried."""
+    attempts = 0
+
+    async def bad_gateway(_request: web.Request) -> web.Response:
+        nonlocal attempts
+        attempts += 1
+        return web.Response(status=502, text="<html>Bad Gateway</html>")
+
+    app = web.Application()
+    app.router.add_post("/appsync/group/dev/query", bad_gateway)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    # An external session without raise_for_status, like Home Assistant's
+    external_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(resolver=aiohttp.ThreadedResolver())
+    )
+    try:
+        api = AuxCloudAPI("test@example.com", "password", session=external_session)
+        api.url = str(server.make_url("")).rstrip("/")
+
+        with pytest.raises(tenacity.RetryError) as exc_info:
+            await api.list_devices("family1")
+
+        last_error = exc_info.value.last_attempt.exception()
+        assert isinstance(last_error, aiohttp.ClientResponseError)
+        assert last_error.status == HTTP_BAD_GATEWAY
+        assert attempts == NUM_OF_API_RETRIES
+    finally:
+        await external_session.close()
+        await server.close()
+
+
 @pytest.mark.asyncio
 async def test_dns_cache() -> None:
     """Test that DNS cache is working."""
@@ -0,0 +1,100 @@
+"""Tests for the Tornado AC integration setup."""
+
+from collections.abc import Generator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.tornado import async_setup_entry
+from custom_components.tornado.climate import TornadoClimateEntity
+from custom_components.tornado.climate import (
+    async_setup_entry as async_setup_climate_entry,
+)
+from custom_components.tornado.const import (
+    CONF_EMAIL,
+    CONF_PASSWORD,
+    CONF_REGION,
+    DOMAIN,
+)
+
+MOCK_DEVICE = {
+    "endpointId": "test_device_id",
+    "friendlyName": "Test AC",
+    "params": {"pwr": 0},
+}
+
+
+@pytest.fixture
+def config_entry() -> MagicMock:
+    """Create a mock config entry."""
+    entry = MagicMock()
+    entry.entry_id = "test"
+    entry.data = {
+        CONF_EMAIL: "test@example.com",
+        CONF_PASSWORD: "secret",
+        CONF_REGION: "eu",
+    }
+    return entry
+
+
+@pytest.fixture
+def mock_client() -> Generator[MagicMock, None, None]:
+    """Patch the AuxCloud API client used by the integration."""
+    client = MagicMock()
+    client.loginsession = "test_session"
+    client.login = AsyncMock(return_value=True)
+    client.get_devices = AsyncMock(return_value=[MOCK_DEVICE])
+    client.cleanup = AsyncMock()
+    with (
+        patch("custom_components.tornado.AuxCloudAPI", return_value=client),
+        patch("custom_components.tornado.async_get_clientsession"),
+    ):
+        yield client
+
+
+async def test_setup_entry_fetches_devices_once(
+    hass: HomeAssistant, config_entry: MagicMock, mock_client: MagicMock
+) -> None:
+    """Test that entry and platform setup share a single device fetch."""
+    async_add_entities = MagicMock()
+
+    async def forward_entry_setups(entry: MagicMock, _platforms: list) -> None:
+        await async_setup_climate_entry(hass, entry, async_add_entities)
+
+    with patch.object(
+        hass.config_entries,
+        "async_forward_entry_setups",
+        side_effect=forward_entry_setups,
+    ):
+        assert await async_setup_entry(hass, config_entry) is True
+
+    mock_client.get_devices.assert_awaited_once()
+    # The startup snapshot is not kept once the platform has consumed it
+    assert "devices" not in hass.data[DOMAIN][config_entry.entry_id]
+
+    entities = async_add_entities.call_args.args[0]
+    assert len(entities) == 1
+    assert isinstance(entities[0], TornadoClimateEntity)
+    # The coordinator is seeded from the devices fetched during entry setup
+    assert entities[0]._coordinator.data == {MOCK_DEVICE["endpointId"]: MOCK_DEVICE}
+    mock_client.cleanup.assert_not_called()
+
+    await entities[0]._coordinator.async_shutdown()
+
+
+async def test_setup_entry_login_failure_cleans_up(
+    hass: HomeAssistant, config_entry: MagicMock, mock_client: MagicMock
+) -> None:
+    """Test that the client is cleaned up when login fails."""
+    mock_client.login.side_effect = Exception("Login failed")
+
+    with patch.object(
+        hass.config_entries, "async_forward_entry_setups"
+    ) as mock_forward:
+        assert await async_setup_entry(hass, config_entry) is False
+
+    mock_client.cleanup.assert_awaited_once()
+    mock_client.get_devices.assert_not_called()
+    mock_forward.assert_not_called()
+    assert "client" not in hass.data[DOMAIN][config_entry.entry_id]